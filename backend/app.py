@@ -6,10 +6,14 @@ app.py - Flask application for Weekly Report and OKR Assistant
 
 import os
 import logging
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import sqlite3
+import orjson
+from functools import wraps
+from flask import Flask, request, jsonify, Response
+from flask.json.provider import JSONProvider
+from werkzeug.routing import BaseConverter
 from generator import generate_weekly_report, generate_okr, validate_weekly_report, validate_okr
-from parser import parse_and_categorize, get_current_week_range, format_date
+from parser import parse_and_categorize, get_current_week_range_str
 from config import Config
 import database as db
 
@@ -20,44 +24,207 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _ojson_default(obj):
+    """
+    Fallback for types orjson can't serialize natively.
+
+    Lets handlers hand sqlite3.Row objects and sets straight to the
+    serializer instead of rebuilding them as dicts/lists first.
+    """
+    if isinstance(obj, sqlite3.Row):
+        return dict(zip(obj.keys(), obj))
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson's C serializer.
+
+    Flask 3.x routes both request.get_json() and jsonify() through
+    app.json, so installing this provider speeds up every endpoint
+    without touching individual handlers.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_ojson_default,
+                            option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+class DateConverter(BaseConverter):
+    """Match YYYY-MM-DD path segments at the routing layer.
+
+    Malformed dates 404 during URL matching, before the handler runs or
+    the database is queried.
+    """
+
+    regex = r'\d{4}-\d{2}-\d{2}'
+
+
+class CORSMiddleware:
+    """WSGI middleware enabling CORS for the React frontend.
+
+    OPTIONS preflights are answered at the top of the stack with a
+    static 204 + header block, without entering Flask's routing; other
+    requests pass through with the CORS headers appended to the
+    response.
+    """
+
+    _headers = [
+        ('Access-Control-Allow-Origin', '*'),
+        ('Access-Control-Allow-Methods', 'GET,POST,PUT,DELETE,OPTIONS'),
+        ('Access-Control-Allow-Headers', 'Content-Type'),
+    ]
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        if environ['REQUEST_METHOD'] == 'OPTIONS':
+            start_response('204 No Content', list(self._headers))
+            return [b'']
+
+        def _start_response(status, headers, exc_info=None):
+            return start_response(status, headers + self._headers, exc_info)
+
+        return self.wsgi_app(environ, _start_response)
+
+
 # Create Flask app
 app = Flask(__name__)
-CORS(app)  # Enable CORS for React frontend
+app.json = OrjsonProvider(app)
+app.url_map.converters['date'] = DateConverter
+app.wsgi_app = CORSMiddleware(app.wsgi_app)  # Enable CORS for React frontend
 
 
-@app.route('/api/health', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
+def ojson(obj, status=200) -> Response:
+    """
+    Serialize a response body with orjson in a single C-level pass.
+
+    Skips jsonify's provider/response indirection, which matters for
+    list endpoints returning many DB rows.
+    """
+    return Response(orjson.dumps(obj, default=_ojson_default),
+                    status=status, mimetype='application/json')
+
+
+def ojson_stream(items) -> Response:
+    """
+    Stream a {"success": true, "data": [...]} body item by item.
+
+    Each element is serialized with orjson as it is produced, so large
+    lists leave via chunked transfer encoding instead of being buffered
+    whole in memory first.
+    """
+    def generate():
+        yield b'{"success":true,"data":['
+        first = True
+        for item in items:
+            if first:
+                first = False
+            else:
+                yield b','
+            yield orjson.dumps(item, default=_ojson_default)
+        yield b']}'
+
+    return Response(generate(), mimetype='application/json')
+
+
+def require_fields(*fields):
+    """
+    Reject the request with 400 unless the JSON body contains all the
+    given fields, then pass the parsed body to the handler as its first
+    argument.
+
+    One frozenset.issubset() check replaces the repeated
+    `if not data or 'x' not in data or ...` chains in every POST/PUT
+    handler, and the body is parsed exactly once.
+    """
+    required = frozenset(fields)
+
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            data = request.get_json(silent=True)
+            if not isinstance(data, dict) or not required.issubset(data):
+                present = set(data) if isinstance(data, dict) else set()
+                missing = sorted(required - present)
+                return ojson({
+                    'success': False,
+                    'error': f"缺少 {'、'.join(missing)} 字段"
+                }, 400)
+            return fn(data, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# A JSON body whose content fits MAX_INPUT_CHARS can't exceed this many
+# bytes (worst case 4 UTF-8 bytes per char, plus escaping/envelope slack)
+_MAX_BODY_BYTES = Config.MAX_INPUT_CHARS * 4 + 4096
+
+# The bulk endpoints carry many items that are each limited individually,
+# so the single-document cap doesn't apply to them
+_BULK_PATHS = frozenset({'/api/daily-reports/bulk', '/api/okr-reports/bulk'})
+
+
+@app.before_request
+def reject_oversized_body():
+    """
+    Reject clearly oversized requests from the Content-Length header,
+    before the body is ever read or JSON-parsed. The per-field character
+    checks in the handlers still enforce the exact limit. Bulk endpoints
+    are exempt — their payload scales with item count, not field size.
+    """
+    if request.path in _BULK_PATHS:
+        return None
+    length = request.content_length
+    if length is not None and length > _MAX_BODY_BYTES:
+        return ojson({
+            'success': False,
+            'error': f'输入超过最大长度限制 ({Config.MAX_INPUT_CHARS} 字符)'
+        }, 413)
+
+
+# The health payload is static apart from the llm_configured flag, so
+# keep both variants pre-serialized and pick one per request
+_HEALTH_BODY = {
+    flag: orjson.dumps({
         'status': 'healthy',
-        'llm_configured': Config.is_llm_configured(),
+        'llm_configured': flag,
         'max_input_chars': Config.MAX_INPUT_CHARS
     })
+    for flag in (True, False)
+}
+
+
+def health_check():
+    """Health check endpoint"""
+    return Response(_HEALTH_BODY[Config.is_llm_configured()], mimetype='application/json')
+
+
+app.add_url_rule('/api/health', 'health_check', health_check, methods=['GET'])
 
 
 @app.route('/api/week-range', methods=['GET'])
 def get_week_range():
     """Get current week's Monday-Friday date range"""
-    monday, friday = get_current_week_range()
+    monday, friday = get_current_week_range_str()
     return jsonify({
-        'monday': format_date(monday),
-        'friday': format_date(friday)
+        'monday': monday,
+        'friday': friday
     })
 
 
 @app.route('/api/parse', methods=['POST'])
-def parse_daily_report():
+@require_fields('content')
+def parse_daily_report(data):
     """
     Parse daily report content without generating weekly report.
     Useful for preview/debugging.
     """
-    data = request.get_json()
-    if not data or 'content' not in data:
-        return jsonify({
-            'success': False,
-            'error': '缺少 content 字段'
-        }), 400
-    
     content = data['content']
     
     if len(content) > Config.MAX_INPUT_CHARS:
@@ -81,7 +248,8 @@ def parse_daily_report():
 
 
 @app.route('/api/generate/weekly-report', methods=['POST'])
-def api_generate_weekly_report():
+@require_fields('content')
+def api_generate_weekly_report(data):
     """
     Generate weekly report from daily report content.
     
@@ -93,13 +261,6 @@ def api_generate_weekly_report():
         "end_date": "2025-12-12"  // optional, date range end
     }
     """
-    data = request.get_json()
-    if not data or 'content' not in data:
-        return jsonify({
-            'success': False,
-            'error': '缺少 content 字段'
-        }), 400
-    
     content = data['content']
     use_mock = data.get('use_mock', False)
     start_date = data.get('start_date')
@@ -111,23 +272,22 @@ def api_generate_weekly_report():
         logger.info("LLM not configured, using mock mode")
     
     result = generate_weekly_report(
-        content, 
+        content,
         use_mock=use_mock,
         start_date=start_date,
         end_date=end_date
     )
-    
+
+    # Validation is attached by the generator in the same pass
     if result['success']:
-        # Validate the generated report
-        validation = validate_weekly_report(result['report'])
-        result['validation'] = validation
         return jsonify(result)
     else:
         return jsonify(result), 500
 
 
 @app.route('/api/generate/okr', methods=['POST'])
-def api_generate_okr():
+@require_fields('content')
+def api_generate_okr(data):
     """
     Generate OKR from historical materials.
     
@@ -138,13 +298,6 @@ def api_generate_okr():
         "use_mock": false  // optional, default false
     }
     """
-    data = request.get_json()
-    if not data or 'content' not in data:
-        return jsonify({
-            'success': False,
-            'error': '缺少 content 字段'
-        }), 400
-    
     content = data['content']
     next_quarter = data.get('next_quarter', '2026第一季度')
     use_mock = data.get('use_mock', False)
@@ -155,18 +308,17 @@ def api_generate_okr():
         logger.info("LLM not configured, using mock mode")
     
     result = generate_okr(content, next_quarter=next_quarter, use_mock=use_mock)
-    
+
+    # Validation is attached by the generator in the same pass
     if result['success']:
-        # Validate the generated OKR
-        validation = validate_okr(result['okr'])
-        result['validation'] = validation
         return jsonify(result)
     else:
         return jsonify(result), 500
 
 
 @app.route('/api/validate/weekly-report', methods=['POST'])
-def api_validate_weekly_report():
+@require_fields('report')
+def api_validate_weekly_report(data):
     """
     Validate a weekly report against structure requirements.
     
@@ -175,13 +327,6 @@ def api_validate_weekly_report():
         "report": "weekly report text..."
     }
     """
-    data = request.get_json()
-    if not data or 'report' not in data:
-        return jsonify({
-            'success': False,
-            'error': '缺少 report 字段'
-        }), 400
-    
     validation = validate_weekly_report(data['report'])
     return jsonify({
         'success': True,
@@ -190,7 +335,8 @@ def api_validate_weekly_report():
 
 
 @app.route('/api/validate/okr', methods=['POST'])
-def api_validate_okr():
+@require_fields('okr')
+def api_validate_okr(data):
     """
     Validate OKR against structure requirements.
     
@@ -199,13 +345,6 @@ def api_validate_okr():
         "okr": "OKR text..."
     }
     """
-    data = request.get_json()
-    if not data or 'okr' not in data:
-        return jsonify({
-            'success': False,
-            'error': '缺少 okr 字段'
-        }), 400
-    
     validation = validate_okr(data['okr'])
     return jsonify({
         'success': True,
@@ -229,7 +368,8 @@ def internal_error(e):
 # ========================
 
 @app.route('/api/daily-reports', methods=['POST'])
-def save_daily_report():
+@require_fields('entry_date', 'content')
+def save_daily_report(data):
     """
     Save or update a daily report.
     
@@ -239,13 +379,6 @@ def save_daily_report():
         "content": "Daily report content..."
     }
     """
-    data = request.get_json()
-    if not data or 'entry_date' not in data or 'content' not in data:
-        return jsonify({
-            'success': False,
-            'error': '缺少 entry_date 或 content 字段'
-        }), 400
-    
     success = db.save_daily_report(data['entry_date'], data['content'])
     
     if success:
@@ -254,7 +387,39 @@ def save_daily_report():
         return jsonify({'success': False, 'error': '日报保存失败'}), 500
 
 
-@app.route('/api/daily-reports/<entry_date>', methods=['GET'])
+@app.route('/api/daily-reports/bulk', methods=['POST'])
+@require_fields('items')
+def save_daily_reports_bulk(data):
+    """
+    Save or update multiple daily reports in one request.
+
+    Request body:
+    {
+        "items": [
+            {"entry_date": "2025-01-20", "content": "..."},
+            ...
+        ]
+    }
+    """
+    items = data['items']
+    if not isinstance(items, list) or any(
+        not isinstance(item, dict) or 'entry_date' not in item or 'content' not in item
+        for item in items
+    ):
+        return ojson({
+            'success': False,
+            'error': 'items 必须为包含 entry_date 和 content 的数组'
+        }, 400)
+
+    success = db.save_daily_reports_bulk(items)
+
+    if success:
+        return ojson({'success': True, 'message': f'已保存 {len(items)} 条日报'})
+    else:
+        return ojson({'success': False, 'error': '日报批量保存失败'}, 500)
+
+
+@app.route('/api/daily-reports/<date:entry_date>', methods=['GET'])
 def get_daily_report(entry_date):
     """
     Get a daily report by date.
@@ -288,7 +453,7 @@ def get_daily_reports_by_range():
         }), 400
     
     reports = db.get_daily_reports_by_range(start_date, end_date)
-    return jsonify({'success': True, 'data': reports})
+    return ojson({'success': True, 'data': reports})
 
 
 @app.route('/api/daily-reports/dates', methods=['GET'])
@@ -297,10 +462,10 @@ def get_daily_report_dates():
     Get all dates that have daily reports.
     """
     dates = db.get_all_daily_report_dates()
-    return jsonify({'success': True, 'data': dates})
+    return ojson({'success': True, 'data': dates})
 
 
-@app.route('/api/daily-reports/<entry_date>', methods=['DELETE'])
+@app.route('/api/daily-reports/<date:entry_date>', methods=['DELETE'])
 def delete_daily_report(entry_date):
     """
     Delete a daily report by date.
@@ -320,7 +485,8 @@ def delete_daily_report(entry_date):
 # ========================
 
 @app.route('/api/weekly-reports', methods=['POST'])
-def save_weekly_report():
+@require_fields('start_date', 'end_date', 'content')
+def save_weekly_report(data):
     """
     Save or update a weekly report.
     
@@ -331,13 +497,6 @@ def save_weekly_report():
         "content": "Weekly report content..."
     }
     """
-    data = request.get_json()
-    if not data or 'start_date' not in data or 'end_date' not in data or 'content' not in data:
-        return jsonify({
-            'success': False,
-            'error': '缺少 start_date、end_date 或 content 字段'
-        }), 400
-    
     success = db.save_weekly_report(data['start_date'], data['end_date'], data['content'])
     
     if success:
@@ -389,9 +548,21 @@ def get_latest_weekly_report():
 def get_all_weekly_reports():
     """
     Get all weekly reports ordered by end_date descending.
+
+    Streams the list so a long history doesn't get buffered in full.
+    """
+    return ojson_stream(db.iter_all_weekly_reports())
+
+
+@app.route('/api/weekly-reports/list', methods=['GET'])
+def list_weekly_reports():
+    """
+    Get metadata for all weekly reports (no content column).
+
+    Lighter than GET /api/weekly-reports for listing views that only
+    need the date ranges.
     """
-    reports = db.get_all_weekly_reports()
-    return jsonify({'success': True, 'data': reports})
+    return ojson({'success': True, 'data': db.get_all_weekly_report_metadata()})
 
 
 @app.route('/api/weekly-reports', methods=['DELETE'])
@@ -425,7 +596,8 @@ def delete_weekly_report():
 # ========================
 
 @app.route('/api/okr-reports', methods=['POST'])
-def save_okr_report():
+@require_fields('creation_date', 'content')
+def save_okr_report(data):
     """
     Save or update an OKR report.
     
@@ -435,22 +607,47 @@ def save_okr_report():
         "content": "OKR content..."
     }
     """
-    data = request.get_json()
-    if not data or 'creation_date' not in data or 'content' not in data:
-        return jsonify({
+    report = db.save_okr_report_returning(data['creation_date'], data['content'])
+
+    if report:
+        return jsonify({'success': True, 'message': 'OKR保存成功', 'data': report})
+    else:
+        return jsonify({'success': False, 'error': 'OKR保存失败'}), 500
+
+
+@app.route('/api/okr-reports/bulk', methods=['POST'])
+@require_fields('items')
+def save_okr_reports_bulk(data):
+    """
+    Save or update multiple OKR reports in one request.
+
+    Request body:
+    {
+        "items": [
+            {"creation_date": "2025-01-20", "content": "..."},
+            ...
+        ]
+    }
+    """
+    items = data['items']
+    if not isinstance(items, list) or any(
+        not isinstance(item, dict) or 'creation_date' not in item or 'content' not in item
+        for item in items
+    ):
+        return ojson({
             'success': False,
-            'error': '缺少 creation_date 或 content 字段'
-        }), 400
-    
-    success = db.save_okr_report(data['creation_date'], data['content'])
-    
+            'error': 'items 必须为包含 creation_date 和 content 的数组'
+        }, 400)
+
+    success = db.save_okr_reports_bulk(items)
+
     if success:
-        return jsonify({'success': True, 'message': 'OKR保存成功'})
+        return ojson({'success': True, 'message': f'已保存 {len(items)} 条OKR'})
     else:
-        return jsonify({'success': False, 'error': 'OKR保存失败'}), 500
+        return ojson({'success': False, 'error': 'OKR批量保存失败'}, 500)
 
 
-@app.route('/api/okr-reports/<creation_date>', methods=['GET'])
+@app.route('/api/okr-reports/<date:creation_date>', methods=['GET'])
 def get_okr_report(creation_date):
     """
     Get an OKR report by creation date.
@@ -482,12 +679,29 @@ def get_latest_okr_report():
 def get_all_okr_reports():
     """
     Get all OKR reports ordered by creation_date descending.
+
+    The JSON array is built inside SQLite when possible; otherwise the
+    list is streamed so a long history doesn't get buffered in full.
+    """
+    payload = db.get_all_okr_reports_json()
+    if payload is not None:
+        return Response(b'{"success":true,"data":' + payload.encode() + b'}',
+                        mimetype='application/json')
+    return ojson_stream(db.iter_okr_reports())
+
+
+@app.route('/api/okr-reports/list', methods=['GET'])
+def list_okr_reports():
+    """
+    Get summaries for all OKR reports (no content column).
+
+    Lighter than GET /api/okr-reports for listing views that only need
+    the dates and content sizes.
     """
-    reports = db.get_all_okr_reports()
-    return jsonify({'success': True, 'data': reports})
+    return ojson({'success': True, 'data': db.get_all_okr_reports_summary()})
 
 
-@app.route('/api/okr-reports/<creation_date>', methods=['DELETE'])
+@app.route('/api/okr-reports/<date:creation_date>', methods=['DELETE'])
 def delete_okr_report(creation_date):
     """
     Delete an OKR report by creation date.
@@ -512,11 +726,12 @@ def get_todo_items():
     Get all TODO items.
     """
     items = db.get_all_todo_items()
-    return jsonify({'success': True, 'data': items})
+    return ojson({'success': True, 'data': items})
 
 
 @app.route('/api/todo-items', methods=['POST'])
-def create_todo_item():
+@require_fields('content')
+def create_todo_item(data):
     """
     Create a new TODO item.
     
@@ -525,10 +740,6 @@ def create_todo_item():
         "content": "TODO item content"
     }
     """
-    data = request.get_json()
-    if not data or 'content' not in data:
-        return jsonify({'success': False, 'error': '缺少 content 字段'}), 400
-    
     content = data['content'].strip()
     if not content:
         return jsonify({'success': False, 'error': '内容不能为空'}), 400
@@ -596,7 +807,7 @@ def get_all_projects():
     """
     status = request.args.get('status')
     projects = db.get_all_projects(status=status)
-    return jsonify({'success': True, 'data': projects})
+    return ojson({'success': True, 'data': projects})
 
 
 @app.route('/api/projects/summary', methods=['GET'])
@@ -605,7 +816,7 @@ def get_projects_summary():
     Get projects summary with work item counts.
     """
     summary = db.get_projects_summary()
-    return jsonify({'success': True, 'data': summary})
+    return ojson({'success': True, 'data': summary})
 
 
 @app.route('/api/projects/<int:project_id>', methods=['GET'])
@@ -621,7 +832,8 @@ def get_project(project_id):
 
 
 @app.route('/api/projects', methods=['POST'])
-def create_project():
+@require_fields('name')
+def create_project(data):
     """
     Create a new project.
     
@@ -631,10 +843,6 @@ def create_project():
         "description": "Optional description"
     }
     """
-    data = request.get_json()
-    if not data or 'name' not in data:
-        return jsonify({'success': False, 'error': '缺少 name 字段'}), 400
-    
     project = db.create_project(
         name=data['name'],
         description=data.get('description'),
@@ -792,7 +1000,7 @@ def get_all_work_items():
     Get all work items with project info.
     """
     work_items = db.get_all_work_items()
-    return jsonify({'success': True, 'data': work_items})
+    return ojson({'success': True, 'data': work_items})
 
 
 @app.route('/api/work-items/range', methods=['GET'])
@@ -811,11 +1019,12 @@ def get_work_items_by_range():
         return jsonify({'success': False, 'error': '缺少日期参数'}), 400
     
     items = db.get_work_items_by_date_range(start_date, end_date)
-    return jsonify({'success': True, 'data': items})
+    return ojson({'success': True, 'data': items})
 
 
 @app.route('/api/work-items', methods=['POST'])
-def create_work_item():
+@require_fields('raw_log_date')
+def create_work_item(data):
     """
     Create a work item manually.
     
@@ -829,10 +1038,6 @@ def create_work_item():
         "skills_tags": "[\"Python\", \"Redis\"]"  // JSON string, optional
     }
     """
-    data = request.get_json()
-    if not data or 'raw_log_date' not in data:
-        return jsonify({'success': False, 'error': '缺少 raw_log_date 字段'}), 400
-    
     item = db.create_work_item(
         raw_log_date=data['raw_log_date'],
         project_id=data.get('project_id'),
@@ -882,7 +1087,8 @@ def delete_work_item(item_id):
 # --- Extraction API ---
 
 @app.route('/api/extract-work-items', methods=['POST'])
-def extract_work_items_api():
+@require_fields('log_content', 'log_date')
+def extract_work_items_api(data):
     """
     Extract structured work items from daily log content using LLM.
     
@@ -895,10 +1101,6 @@ def extract_work_items_api():
     """
     from generator import extract_work_items, find_best_matching_project
     
-    data = request.get_json()
-    if not data or 'log_content' not in data or 'log_date' not in data:
-        return jsonify({'success': False, 'error': '缺少 log_content 或 log_date 字段'}), 400
-    
     use_mock = not Config.is_llm_configured()
     result = extract_work_items(data['log_content'], data['log_date'], use_mock=use_mock)
     
@@ -966,7 +1168,7 @@ def get_all_skills():
     Get all skills sorted by count.
     """
     skills = db.get_all_skills()
-    return jsonify({'success': True, 'data': skills})
+    return ojson({'success': True, 'data': skills})
 
 
 @app.route('/api/skills/stats', methods=['GET'])
@@ -1035,7 +1237,7 @@ def get_work_items_by_skill(skill_name):
     获取包含指定技能的所有工作条目。
     """
     work_items = db.get_work_items_by_skill(skill_name)
-    return jsonify({
+    return ojson({
         'success': True,
         'data': work_items,
         'skill_name': skill_name
@@ -14,6 +14,9 @@ load_dotenv()
 _db_config_cache = None
 _db_config_loaded = False
 
+# is_llm_configured() 结果缓存（每个请求都会调用，配置变更时失效）
+_llm_configured_cache = None
+
 
 def _load_db_config():
     """从数据库加载 LLM 配置（延迟加载避免循环导入）"""
@@ -35,8 +38,9 @@ def _load_db_config():
 
 def reload_db_config():
     """强制重新加载数据库配置"""
-    global _db_config_cache, _db_config_loaded
+    global _db_config_cache, _db_config_loaded, _llm_configured_cache
     _db_config_loaded = False
+    _llm_configured_cache = None
     return _load_db_config()
 
 
@@ -111,14 +115,22 @@ class Config:
     @classmethod
     def is_llm_configured(cls):
         """Check if LLM is properly configured (from database or environment)"""
+        global _llm_configured_cache
+
+        # 结果已缓存（保存配置时通过 reload_db_config 失效）
+        if _llm_configured_cache is not None:
+            return _llm_configured_cache
+
         # 首先检查数据库配置
         db_config = _load_db_config()
         if db_config and db_config.get('api_url') and db_config.get('api_key'):
-            return True
-        
-        # 检查 DeepSeek API 配置
-        if cls.DEEPSEEK_API_KEY:
-            return True
-        
-        # 回退到通用 LLM 配置
-        return bool(cls.LLM_API_URL and cls.LLM_API_KEY)
+            configured = True
+        elif cls.DEEPSEEK_API_KEY:
+            # 检查 DeepSeek API 配置
+            configured = True
+        else:
+            # 回退到通用 LLM 配置
+            configured = bool(cls.LLM_API_URL and cls.LLM_API_KEY)
+
+        _llm_configured_cache = configured
+        return configured
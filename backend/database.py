@@ -6,32 +6,165 @@ database.py - SQLite database module for Weekly Report and OKR Assistant
 
 import sqlite3
 import os
+import atexit
 import logging
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
 
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Database file path
 DB_PATH = os.path.join(os.path.dirname(__file__), 'data', 'reports.db')
 
+# Per-thread cached connection (opening SQLite per call costs more than
+# most of the queries themselves)
+_local = threading.local()
+
+class _Connection(sqlite3.Connection):
+    """Connection subclass that supports weak references.
+
+    The base C type can't be weakly referenced, which the registry
+    below relies on.
+    """
+
+
+# Weak references to every open connection, so they can all be closed
+# at shutdown even though each lives in a different thread's local
+# storage. Weak so the registry never pins connections whose owning
+# thread (or greenlet, under gevent) is gone — those are closed by GC
+# when the thread-local storage is collected.
+_connections: 'weakref.WeakSet[sqlite3.Connection]' = weakref.WeakSet()
+_connections_lock = threading.Lock()
+
+# Lazy schema initialization state (see _ensure_schema)
+_schema_ready = False
+_init_lock = threading.Lock()
+
 
 def get_db_connection() -> sqlite3.Connection:
     """
-    Get a database connection with row factory for dict-like access.
-    
+    Get the calling thread's cached database connection, opening it on
+    first use. Row factory is set for dict-like access and WAL mode is
+    enabled so readers don't block the writer.
+
     Returns:
         sqlite3.Connection: Database connection
     """
-    # Ensure data directory exists
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        return conn
+
+    # Ensure data directory exists before the first connection is opened
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    
-    conn = sqlite3.connect(DB_PATH)
+
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                           cached_statements=256, factory=_Connection)
     conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    # Memory-map the database file (256 MB window) so reads come straight
+    # from the OS page cache without a read() syscall per page, and keep a
+    # 20 MB page cache per connection for the read-heavy list endpoints.
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA cache_size=-20000')
+    # Wait up to 5s for a competing writer instead of failing immediately
+    # with "database is locked".
+    conn.execute('PRAGMA busy_timeout=5000')
+    _local.conn = conn
+    with _connections_lock:
+        _connections.add(conn)
+    _ensure_schema()
     return conn
 
 
+def _ensure_schema() -> None:
+    """
+    Run init_database once per process, triggered by the first
+    connection instead of at import time, so importing the module stays
+    cheap and workers don't re-parse CREATE TABLE IF NOT EXISTS on
+    every startup path that never touches the database.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _init_lock:
+        if not _schema_ready:
+            init_database()
+            _assert_okr_plans(get_db_connection())
+            _schema_ready = True
+
+
+def close_all_connections() -> None:
+    """
+    Close every cached connection, checkpointing the WAL back into the
+    main database file. Registered with atexit; safe to call again.
+    """
+    with _connections_lock:
+        conns = list(_connections)
+        _connections.clear()
+
+    for conn in conns:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    _local.conn = None
+
+
+atexit.register(close_all_connections)
+
+
+@contextmanager
+def _tx(conn: sqlite3.Connection):
+    """
+    Group the enclosed statements into one transaction.
+
+    Connections run in autocommit (isolation_level=None), so functions
+    issuing several statements must group them into one transaction
+    themselves instead of paying a WAL commit per statement. Commits on
+    normal exit (including early returns) and rolls back on error, so a
+    failed writer never leaves the thread's cached connection stuck in
+    an open transaction.
+    """
+    if not conn.in_transaction:
+        conn.execute('BEGIN')
+    try:
+        yield
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    else:
+        if conn.in_transaction:
+            conn.commit()
+
+
+def _fetch_all_dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    """
+    Materialize every remaining row on a cursor as a dict.
+
+    Switches the cursor to plain-tuple rows and builds the dicts once
+    from cursor.description, which is cheaper than fetching sqlite3.Row
+    objects and converting each with dict(row).
+    """
+    cursor.row_factory = None
+    cols = [c[0] for c in cursor.description]
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+
 def init_database():
     """
     Initialize the database with required tables.
@@ -145,14 +278,26 @@ def init_database():
             )
         ''')
         
+        # Indexes for the hot lookup paths（按日期查询/排序）
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_weekly_reports_end_date
+            ON weekly_reports(end_date DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_work_items_raw_log_date
+            ON work_items(raw_log_date DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_work_items_project_id
+            ON work_items(project_id)
+        ''')
+
         conn.commit()
         logger.info("Database initialized successfully")
         
     except Exception as e:
         logger.error(f"Database initialization error: {e}")
         raise
-    finally:
-        conn.close()
 
 
 # ========================
@@ -183,14 +328,48 @@ def save_daily_report(entry_date: str, content: str) -> bool:
         ''', (entry_date, content))
         
         conn.commit()
-        logger.info(f"Daily report saved for {entry_date}")
+        logger.debug(f"Daily report saved for {entry_date}")
         return True
         
     except Exception as e:
         logger.error(f"Error saving daily report: {e}")
         return False
-    finally:
-        conn.close()
+
+
+def save_daily_reports_bulk(items: List[Dict[str, str]]) -> bool:
+    """
+    Save or update multiple daily reports in a single transaction.
+
+    Args:
+        items: List of dicts with entry_date and content keys
+
+    Returns:
+        bool: True if all items were saved
+    """
+    if not items:
+        return True
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute('BEGIN')
+        cursor.executemany('''
+            INSERT INTO daily_reports (entry_date, content, updated_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(entry_date) DO UPDATE SET
+                content = excluded.content,
+                updated_at = CURRENT_TIMESTAMP
+        ''', [(item['entry_date'], item['content']) for item in items])
+
+        conn.commit()
+        logger.debug(f"Saved {len(items)} daily reports in bulk")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error saving daily reports in bulk: {e}")
+        conn.rollback()
+        return False
 
 
 def get_daily_report(entry_date: str) -> Optional[Dict[str, Any]]:
@@ -220,8 +399,6 @@ def get_daily_report(entry_date: str) -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Error getting daily report: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_daily_reports_by_range(start_date: str, end_date: str) -> List[Dict[str, Any]]:
@@ -245,14 +422,11 @@ def get_daily_reports_by_range(start_date: str, end_date: str) -> List[Dict[str,
             ORDER BY entry_date
         ''', (start_date, end_date))
         
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
         
     except Exception as e:
         logger.error(f"Error getting daily reports: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def get_all_daily_report_dates() -> List[str]:
@@ -267,14 +441,12 @@ def get_all_daily_report_dates() -> List[str]:
     
     try:
         cursor.execute('SELECT entry_date FROM daily_reports ORDER BY entry_date DESC')
-        rows = cursor.fetchall()
-        return [row['entry_date'] for row in rows]
+        cursor.row_factory = None
+        return [row[0] for row in cursor.fetchall()]
         
     except Exception as e:
         logger.error(f"Error getting daily report dates: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def delete_daily_report(entry_date: str) -> bool:
@@ -298,8 +470,6 @@ def delete_daily_report(entry_date: str) -> bool:
     except Exception as e:
         logger.error(f"Error deleting daily report: {e}")
         return False
-    finally:
-        conn.close()
 
 
 # ========================
@@ -331,14 +501,12 @@ def save_weekly_report(start_date: str, end_date: str, content: str) -> bool:
         ''', (start_date, end_date, content))
         
         conn.commit()
-        logger.info(f"Weekly report saved for {start_date} ~ {end_date}")
+        logger.debug(f"Weekly report saved for {start_date} ~ {end_date}")
         return True
         
     except Exception as e:
         logger.error(f"Error saving weekly report: {e}")
         return False
-    finally:
-        conn.close()
 
 
 def get_weekly_report(start_date: str, end_date: str) -> Optional[Dict[str, Any]]:
@@ -369,8 +537,6 @@ def get_weekly_report(start_date: str, end_date: str) -> Optional[Dict[str, Any]
     except Exception as e:
         logger.error(f"Error getting weekly report: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_latest_weekly_report() -> Optional[Dict[str, Any]]:
@@ -384,14 +550,33 @@ def get_latest_weekly_report() -> Optional[Dict[str, Any]]:
     cursor = conn.cursor()
     
     try:
-        today = date.today().isoformat()
+        # Two index probes on end_date instead of a full scan with
+        # ABS(julianday(...)) computed per row
+        today = date.today()
+        today_str = today.isoformat()
         cursor.execute('''
-            SELECT * FROM weekly_reports 
-            ORDER BY ABS(julianday(end_date) - julianday(?))
+            SELECT * FROM weekly_reports
+            WHERE end_date <= ?
+            ORDER BY end_date DESC
             LIMIT 1
-        ''', (today,))
-        row = cursor.fetchone()
-        
+        ''', (today_str,))
+        past = cursor.fetchone()
+
+        cursor.execute('''
+            SELECT * FROM weekly_reports
+            WHERE end_date > ?
+            ORDER BY end_date ASC
+            LIMIT 1
+        ''', (today_str,))
+        future = cursor.fetchone()
+
+        if past and future:
+            past_diff = (today - date.fromisoformat(past['end_date'])).days
+            future_diff = (date.fromisoformat(future['end_date']) - today).days
+            row = past if past_diff <= future_diff else future
+        else:
+            row = past or future
+
         if row:
             return dict(row)
         return None
@@ -399,8 +584,6 @@ def get_latest_weekly_report() -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Error getting latest weekly report: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_all_weekly_reports() -> List[Dict[str, Any]]:
@@ -418,14 +601,69 @@ def get_all_weekly_reports() -> List[Dict[str, Any]]:
             SELECT * FROM weekly_reports 
             ORDER BY end_date DESC
         ''')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
         
     except Exception as e:
         logger.error(f"Error getting all weekly reports: {e}")
         return []
-    finally:
-        conn.close()
+
+
+def get_all_weekly_report_metadata() -> List[Dict[str, Any]]:
+    """
+    Get all weekly reports without their content, ordered by end_date
+    descending.
+
+    Projects only (start_date, end_date, updated_at), so listing views
+    don't pull the potentially multi-KB content column per row.
+
+    Returns:
+        List of weekly report metadata dicts
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute('''
+            SELECT start_date, end_date, updated_at FROM weekly_reports
+            ORDER BY end_date DESC
+        ''')
+        return _fetch_all_dicts(cursor)
+
+    except Exception as e:
+        logger.error(f"Error getting weekly report metadata: {e}")
+        return []
+
+
+def iter_all_weekly_reports(batch_size: int = 100):
+    """
+    Iterate weekly reports ordered by end_date descending.
+
+    Yields one dict per report, fetching in batches, so callers can
+    stream a large history without materializing the full list first.
+
+    Args:
+        batch_size: Rows fetched from SQLite per batch
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute('''
+            SELECT * FROM weekly_reports
+            ORDER BY end_date DESC
+        ''')
+        cursor.row_factory = None
+        cols = [c[0] for c in cursor.description]
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(cols, row))
+
+    except Exception as e:
+        logger.error(f"Error iterating weekly reports: {e}")
 
 
 def search_weekly_reports(start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
@@ -457,14 +695,11 @@ def search_weekly_reports(start_date: str = None, end_date: str = None) -> List[
         query += ' ORDER BY end_date DESC'
         
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
         
     except Exception as e:
         logger.error(f"Error searching weekly reports: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def delete_weekly_report(start_date: str, end_date: str) -> bool:
@@ -492,14 +727,206 @@ def delete_weekly_report(start_date: str, end_date: str) -> bool:
     except Exception as e:
         logger.error(f"Error deleting weekly report: {e}")
         return False
-    finally:
-        conn.close()
 
 
 # ========================
 # OKR Reports CRUD
 # ========================
 
+# OKR content is stored zstd-compressed when the zstandard package is
+# available; compressed values are recognized on read by the zstd frame
+# magic, so plain-text rows written before (or without) zstandard keep
+# working. Note that rows already compressed still need the package to
+# read — uninstalling it only stops compression of new writes
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+_ZSTD_MIN_BYTES = 512
+
+if HAS_ZSTD:
+    _zstd_compressor = zstandard.ZstdCompressor()
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+
+
+def _compress_content(content: str):
+    """
+    Compress OKR content for storage, when worthwhile.
+
+    Returns the original string when zstandard is unavailable or the
+    text is too short for compression to pay for itself.
+    """
+    if not HAS_ZSTD:
+        return content
+    raw = content.encode('utf-8')
+    if len(raw) < _ZSTD_MIN_BYTES:
+        return content
+    return _zstd_compressor.compress(raw)
+
+
+def _decompress_content(value) -> str:
+    """
+    Restore OKR content, decompressing zstd frames transparently.
+
+    Unreadable values — a compressed row on a deployment without
+    zstandard, or a corrupt frame — are logged and degrade to an empty
+    string instead of erroring the whole read path.
+    """
+    if not isinstance(value, bytes):
+        return value
+    if value[:4] == _ZSTD_MAGIC:
+        if not HAS_ZSTD:
+            logger.error("Cannot read zstd-compressed OKR content: zstandard is not installed")
+            return ''
+        try:
+            return _zstd_decompressor.decompress(value).decode('utf-8')
+        except (zstandard.ZstdError, UnicodeDecodeError):
+            logger.error("Corrupt zstd-compressed OKR content", exc_info=True)
+            return ''
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        logger.error("Undecodable OKR content blob", exc_info=True)
+        return ''
+
+
+# Fixed column order shared by the okr_reports readers, so single-row
+# fetches can build their dict from a plain tuple instead of paying the
+# sqlite3.Row machinery per row
+_OKR_COLS = ('creation_date', 'content', 'created_at', 'updated_at')
+
+# okr_reports statements hoisted to constants: the identical interned
+# string hits sqlite3's cached_statements lookup every call, and keeping
+# them together lets _assert_okr_plans() sanity-check the query plans
+_SQL_OKR_UPSERT = '''
+    INSERT INTO okr_reports (creation_date, content, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(creation_date) DO UPDATE SET
+        content = excluded.content,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE excluded.content IS NOT okr_reports.content
+    RETURNING creation_date, content, created_at, updated_at
+'''
+
+_SQL_OKR_BULK_UPSERT = '''
+    INSERT INTO okr_reports (creation_date, content, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(creation_date) DO UPDATE SET
+        content = excluded.content,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE excluded.content IS NOT okr_reports.content
+'''
+
+_SQL_OKR_GET_ONE = '''
+    SELECT creation_date, content, created_at, updated_at
+    FROM okr_reports WHERE creation_date = ?
+'''
+
+# creation_date is the TEXT primary key, so the subquery is a single
+# B-tree seek to the last key rather than a sort
+_SQL_OKR_GET_LATEST = '''
+    SELECT creation_date, content, created_at, updated_at
+    FROM okr_reports
+    WHERE creation_date = (SELECT MAX(creation_date) FROM okr_reports)
+'''
+
+_SQL_OKR_GET_ALL = '''
+    SELECT creation_date, content, created_at, updated_at
+    FROM okr_reports
+    ORDER BY creation_date DESC
+'''
+
+_SQL_OKR_SUMMARY = '''
+    SELECT creation_date, updated_at, length(content) AS size
+    FROM okr_reports
+    ORDER BY creation_date DESC
+'''
+
+_SQL_OKR_HAS_BLOB = '''
+    SELECT EXISTS(SELECT 1 FROM okr_reports WHERE typeof(content) = 'blob')
+'''
+
+_SQL_OKR_JSON = '''
+    SELECT json_group_array(json_object(
+        'creation_date', creation_date,
+        'content', content,
+        'created_at', created_at,
+        'updated_at', updated_at
+    ))
+    FROM (
+        SELECT creation_date, content, created_at, updated_at
+        FROM okr_reports
+        ORDER BY creation_date DESC
+    )
+'''
+
+_SQL_OKR_DELETE = '''
+    DELETE FROM okr_reports WHERE creation_date = ? RETURNING 1
+'''
+
+
+def _assert_okr_plans(conn: sqlite3.Connection) -> None:
+    """
+    Log a warning if the hot okr_reports lookups stop using an index.
+
+    Run once at schema initialization so a schema change that degrades
+    these statements to a table scan shows up in the logs instead of as
+    a silent latency regression.
+    """
+    for sql in (_SQL_OKR_GET_ONE, _SQL_OKR_DELETE):
+        try:
+            plan = ' | '.join(
+                row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, ('',))
+            )
+            if 'USING INDEX' not in plan and 'USING COVERING INDEX' not in plan:
+                logger.warning("okr_reports statement no longer indexed: %s", plan)
+        except sqlite3.Error:
+            logger.warning("Could not check okr_reports query plan", exc_info=True)
+
+# OKR reports are written rarely but read on every UI render, so the
+# readers below serve from a small LRU keyed by creation_date (plus a
+# sentinel for "latest"); the writers invalidate it.
+_OKR_CACHE_MAX = 128
+_OKR_LATEST_KEY = '\x00latest'
+_okr_cache: OrderedDict = OrderedDict()
+_okr_cache_lock = threading.Lock()
+
+# Serializes the OKR writers in-process: a userland lock acquire costs
+# nanoseconds, while losing the race for SQLite's write lock costs a
+# busy-timeout sleep per retry. Readers never take it (WAL keeps them
+# concurrent with the writer).
+_write_lock = threading.Lock()
+
+
+def _okr_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of the cached report for key, or None on miss."""
+    with _okr_cache_lock:
+        report = _okr_cache.get(key)
+        if report is None:
+            return None
+        _okr_cache.move_to_end(key)
+        return dict(report)
+
+
+def _okr_cache_put(key: str, report: Dict[str, Any]) -> None:
+    """Store a report under key, evicting the least recently used."""
+    with _okr_cache_lock:
+        _okr_cache[key] = dict(report)
+        _okr_cache.move_to_end(key)
+        while len(_okr_cache) > _OKR_CACHE_MAX:
+            _okr_cache.popitem(last=False)
+
+
+def _okr_cache_invalidate(creation_date: Optional[str] = None) -> None:
+    """
+    Drop the cached entry for creation_date and the "latest" sentinel,
+    or the whole cache when no date is given.
+    """
+    with _okr_cache_lock:
+        if creation_date is None:
+            _okr_cache.clear()
+        else:
+            _okr_cache.pop(creation_date, None)
+            _okr_cache.pop(_OKR_LATEST_KEY, None)
+
+
 def save_okr_report(creation_date: str, content: str) -> bool:
     """
     Save or update an OKR report.
@@ -511,27 +938,98 @@ def save_okr_report(creation_date: str, content: str) -> bool:
     Returns:
         bool: True if successful
     """
+    return save_okr_report_returning(creation_date, content) is not None
+
+
+def save_okr_report_returning(creation_date: str, content: str) -> Optional[Dict[str, Any]]:
+    """
+    Save or update an OKR report and return the stored row.
+
+    Uses RETURNING so the save→display path reads the row back in the
+    same statement instead of a second query.
+
+    Args:
+        creation_date: Creation date in YYYY-MM-DD format
+        content: OKR content
+
+    Returns:
+        Dict with creation_date, content, created_at, updated_at or
+        None on failure
+    """
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute('''
-            INSERT INTO okr_reports (creation_date, content, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(creation_date) DO UPDATE SET
-                content = excluded.content,
-                updated_at = CURRENT_TIMESTAMP
-        ''', (creation_date, content))
-        
-        conn.commit()
-        logger.info(f"OKR report saved for {creation_date}")
+
+    with _write_lock:
+        try:
+            # Take the write lock up front instead of upgrading at COMMIT,
+            # so concurrent writers queue on busy_timeout deterministically
+            conn.execute('BEGIN IMMEDIATE')
+            cursor = conn.execute(_SQL_OKR_UPSERT,
+                                  (creation_date, _compress_content(content)))
+            cursor.row_factory = None
+            row = cursor.fetchone()
+
+            conn.commit()
+            _okr_cache_invalidate(creation_date)
+            logger.debug("OKR report saved for %s", creation_date)
+
+            if row is None:
+                # Content was unchanged, so the upsert skipped the write
+                # and returned nothing; serve the existing row instead
+                return get_okr_report(creation_date)
+
+            report = dict(zip(_OKR_COLS, row))
+            report['content'] = _decompress_content(report['content'])
+            _okr_cache_put(creation_date, report)
+            return report
+
+        except sqlite3.Error:
+            logger.error("Error saving OKR report for %s", creation_date, exc_info=True)
+            conn.rollback()
+            return None
+
+
+def save_okr_reports_bulk(items: List[Dict[str, str]], chunk_size: int = 1000) -> bool:
+    """
+    Save or update multiple OKR reports in chunked transactions.
+
+    Each chunk commits separately so a huge import never holds the
+    write lock (or grows the WAL) for its full duration; readers get a
+    window between chunks. Chunks that committed before a failure stay
+    committed.
+
+    Args:
+        items: List of dicts with creation_date and content keys
+        chunk_size: Rows written per transaction
+
+    Returns:
+        bool: True if all items were saved
+    """
+    if not items:
         return True
-        
-    except Exception as e:
-        logger.error(f"Error saving OKR report: {e}")
-        return False
-    finally:
-        conn.close()
+
+    conn = get_db_connection()
+
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+
+        with _write_lock:
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                conn.executemany(_SQL_OKR_BULK_UPSERT,
+                                 [(item['creation_date'], _compress_content(item['content']))
+                                  for item in chunk])
+
+                conn.commit()
+
+            except sqlite3.Error:
+                logger.error("Error saving OKR reports in bulk", exc_info=True)
+                conn.rollback()
+                _okr_cache_invalidate()
+                return False
+
+    _okr_cache_invalidate()
+    logger.debug("Saved %d OKR reports in bulk", len(items))
+    return True
 
 
 def get_okr_report(creation_date: str) -> Optional[Dict[str, Any]]:
@@ -544,25 +1042,27 @@ def get_okr_report(creation_date: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with creation_date, content, created_at, updated_at or None
     """
+    cached = _okr_cache_get(creation_date)
+    if cached is not None:
+        return cached
+
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
+
     try:
-        cursor.execute(
-            'SELECT * FROM okr_reports WHERE creation_date = ?',
-            (creation_date,)
-        )
+        cursor = conn.execute(_SQL_OKR_GET_ONE, (creation_date,))
+        cursor.row_factory = None
         row = cursor.fetchone()
-        
+
         if row:
-            return dict(row)
+            report = dict(zip(_OKR_COLS, row))
+            report['content'] = _decompress_content(report['content'])
+            _okr_cache_put(creation_date, report)
+            return report
         return None
         
-    except Exception as e:
-        logger.error(f"Error getting OKR report: {e}")
+    except sqlite3.Error:
+        logger.error("Error getting OKR report for %s", creation_date, exc_info=True)
         return None
-    finally:
-        conn.close()
 
 
 def get_latest_okr_report() -> Optional[Dict[str, Any]]:
@@ -572,26 +1072,27 @@ def get_latest_okr_report() -> Optional[Dict[str, Any]]:
     Returns:
         Dict with OKR report data or None
     """
+    cached = _okr_cache_get(_OKR_LATEST_KEY)
+    if cached is not None:
+        return cached
+
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
+
     try:
-        cursor.execute('''
-            SELECT * FROM okr_reports 
-            ORDER BY creation_date DESC
-            LIMIT 1
-        ''')
+        cursor = conn.execute(_SQL_OKR_GET_LATEST)
+        cursor.row_factory = None
         row = cursor.fetchone()
-        
+
         if row:
-            return dict(row)
+            report = dict(zip(_OKR_COLS, row))
+            report['content'] = _decompress_content(report['content'])
+            _okr_cache_put(_OKR_LATEST_KEY, report)
+            return report
         return None
         
-    except Exception as e:
-        logger.error(f"Error getting latest OKR report: {e}")
+    except sqlite3.Error:
+        logger.error("Error getting latest OKR report", exc_info=True)
         return None
-    finally:
-        conn.close()
 
 
 def get_all_okr_reports() -> List[Dict[str, Any]]:
@@ -601,22 +1102,84 @@ def get_all_okr_reports() -> List[Dict[str, Any]]:
     Returns:
         List of OKR reports
     """
+    return list(iter_okr_reports())
+
+
+def iter_okr_reports(batch_size: int = 100):
+    """
+    Iterate OKR reports ordered by creation_date descending.
+
+    Yields one dict per report, fetching in batches, so callers can
+    stream a large history without materializing the full list first.
+
+    Args:
+        batch_size: Rows fetched from SQLite per batch
+    """
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
+
     try:
-        cursor.execute('''
-            SELECT * FROM okr_reports 
-            ORDER BY creation_date DESC
-        ''')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
-        
-    except Exception as e:
-        logger.error(f"Error getting all OKR reports: {e}")
+        cursor = conn.execute(_SQL_OKR_GET_ALL)
+        cursor.row_factory = None
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                report = dict(zip(_OKR_COLS, row))
+                report['content'] = _decompress_content(report['content'])
+                yield report
+
+    except sqlite3.Error:
+        logger.error("Error iterating OKR reports", exc_info=True)
+
+
+def get_all_okr_reports_json() -> Optional[str]:
+    """
+    Serialize all OKR reports to a JSON array inside SQLite.
+
+    json_group_array(json_object(...)) builds the payload in the engine,
+    skipping the per-row Python dicts and the re-serialization pass
+    entirely. Returns None when any row stores zstd-compressed content
+    (JSON can't hold BLOBs); callers fall back to iter_okr_reports.
+
+    Returns:
+        JSON array string, or None when unavailable
+    """
+    conn = get_db_connection()
+
+    try:
+        compressed = conn.execute(_SQL_OKR_HAS_BLOB).fetchone()[0]
+        if compressed:
+            return None
+
+        return conn.execute(_SQL_OKR_JSON).fetchone()[0]
+
+    except sqlite3.Error:
+        logger.error("Error serializing OKR reports in SQL", exc_info=True)
+        return None
+
+
+def get_all_okr_reports_summary() -> List[Dict[str, Any]]:
+    """
+    Get all OKR reports without their content, ordered by creation_date
+    descending.
+
+    Returns creation_date, updated_at and the content length only, so
+    list views skip reading the content column entirely.
+
+    Returns:
+        List of OKR report summary dicts
+    """
+    conn = get_db_connection()
+
+    try:
+        cursor = conn.execute(_SQL_OKR_SUMMARY)
+        return _fetch_all_dicts(cursor)
+
+    except sqlite3.Error:
+        logger.error("Error getting OKR report summaries", exc_info=True)
         return []
-    finally:
-        conn.close()
 
 
 def delete_okr_report(creation_date: str) -> bool:
@@ -630,18 +1193,21 @@ def delete_okr_report(creation_date: str) -> bool:
         bool: True if successful
     """
     conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    try:
-        cursor.execute('DELETE FROM okr_reports WHERE creation_date = ?', (creation_date,))
-        conn.commit()
-        return cursor.rowcount > 0
-        
-    except Exception as e:
-        logger.error(f"Error deleting OKR report: {e}")
-        return False
-    finally:
-        conn.close()
+
+    with _write_lock:
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # RETURNING 1 reports whether a row matched without going
+            # through cursor.rowcount bookkeeping
+            row = conn.execute(_SQL_OKR_DELETE, (creation_date,)).fetchone()
+            conn.commit()
+            _okr_cache_invalidate(creation_date)
+            return row is not None
+
+        except sqlite3.Error:
+            logger.error("Error deleting OKR report for %s", creation_date, exc_info=True)
+            conn.rollback()
+            return False
 
 
 # ===================
@@ -663,14 +1229,11 @@ def get_all_todo_items() -> List[Dict[str, Any]]:
             SELECT * FROM todo_items 
             ORDER BY sort_order ASC, created_at DESC
         ''')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
         
     except Exception as e:
         logger.error(f"Error getting TODO items: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def create_todo_item(content: str) -> Optional[Dict[str, Any]]:
@@ -687,28 +1250,25 @@ def create_todo_item(content: str) -> Optional[Dict[str, Any]]:
     cursor = conn.cursor()
     
     try:
-        # Get max sort_order
-        cursor.execute('SELECT COALESCE(MAX(sort_order), 0) + 1 FROM todo_items')
-        next_order = cursor.fetchone()[0]
-        
-        now = datetime.now().isoformat()
-        cursor.execute('''
-            INSERT INTO todo_items (content, completed, sort_order, created_at, updated_at)
-            VALUES (?, 0, ?, ?, ?)
-        ''', (content, next_order, now, now))
-        
-        conn.commit()
-        
-        # Get the created item
-        cursor.execute('SELECT * FROM todo_items WHERE id = ?', (cursor.lastrowid,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        with _tx(conn):
+            # Get max sort_order
+            cursor.execute('SELECT COALESCE(MAX(sort_order), 0) + 1 FROM todo_items')
+            next_order = cursor.fetchone()[0]
+
+            now = datetime.now().isoformat()
+            cursor.execute('''
+                INSERT INTO todo_items (content, completed, sort_order, created_at, updated_at)
+                VALUES (?, 0, ?, ?, ?)
+            ''', (content, next_order, now, now))
+
+            # Get the created item
+            cursor.execute('SELECT * FROM todo_items WHERE id = ?', (cursor.lastrowid,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
         
     except Exception as e:
         logger.error(f"Error creating TODO item: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def update_todo_item(item_id: int, content: str = None, completed: bool = None) -> Optional[Dict[str, Any]]:
@@ -762,8 +1322,6 @@ def update_todo_item(item_id: int, content: str = None, completed: bool = None)
     except Exception as e:
         logger.error(f"Error updating TODO item: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def delete_todo_item(item_id: int) -> bool:
@@ -787,8 +1345,6 @@ def delete_todo_item(item_id: int) -> bool:
     except Exception as e:
         logger.error(f"Error deleting TODO item: {e}")
         return False
-    finally:
-        conn.close()
 
 
 # ========================================
@@ -832,8 +1388,6 @@ def create_project(name: str, description: str = None, status: str = 'active') -
     except Exception as e:
         logger.error(f"Error creating project: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_project_by_name(name: str) -> Optional[Dict[str, Any]]:
@@ -848,8 +1402,6 @@ def get_project_by_name(name: str) -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Error getting project: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_project_by_id(project_id: int) -> Optional[Dict[str, Any]]:
@@ -864,8 +1416,6 @@ def get_project_by_id(project_id: int) -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Error getting project: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_all_projects(status: str = None) -> List[Dict[str, Any]]:
@@ -887,13 +1437,10 @@ def get_all_projects(status: str = None) -> List[Dict[str, Any]]:
         else:
             cursor.execute('SELECT * FROM projects ORDER BY updated_at DESC')
         
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting projects: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def update_project(project_id: int, **kwargs) -> Optional[Dict[str, Any]]:
@@ -938,8 +1485,6 @@ def update_project(project_id: int, **kwargs) -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Error updating project: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def delete_project(project_id: int) -> bool:
@@ -948,15 +1493,13 @@ def delete_project(project_id: int) -> bool:
     cursor = conn.cursor()
     
     try:
-        cursor.execute('DELETE FROM work_items WHERE project_id = ?', (project_id,))
-        cursor.execute('DELETE FROM projects WHERE id = ?', (project_id,))
-        conn.commit()
-        return cursor.rowcount > 0
+        with _tx(conn):
+            cursor.execute('DELETE FROM work_items WHERE project_id = ?', (project_id,))
+            cursor.execute('DELETE FROM projects WHERE id = ?', (project_id,))
+            return cursor.rowcount > 0
     except Exception as e:
         logger.error(f"Error deleting project: {e}")
         return False
-    finally:
-        conn.close()
 
 
 def delete_all_projects() -> Dict[str, Any]:
@@ -965,32 +1508,29 @@ def delete_all_projects() -> Dict[str, Any]:
     cursor = conn.cursor()
     
     try:
-        cursor.execute('SELECT COUNT(*) as count FROM projects')
-        project_count = cursor.fetchone()['count']
-        
-        cursor.execute('SELECT COUNT(*) as count FROM work_items')
-        work_item_count = cursor.fetchone()['count']
-        
-        cursor.execute('DELETE FROM work_items')
-        cursor.execute('DELETE FROM projects')
-        cursor.execute('DELETE FROM skills')
-        conn.commit()
-        
-        return {
-            'success': True,
-            'message': f'已删除 {project_count} 个项目和 {work_item_count} 条工作记录',
-            'deleted_projects': project_count,
-            'deleted_work_items': work_item_count
-        }
+        with _tx(conn):
+            cursor.execute('SELECT COUNT(*) as count FROM projects')
+            project_count = cursor.fetchone()['count']
+
+            cursor.execute('SELECT COUNT(*) as count FROM work_items')
+            work_item_count = cursor.fetchone()['count']
+
+            cursor.execute('DELETE FROM work_items')
+            cursor.execute('DELETE FROM projects')
+            cursor.execute('DELETE FROM skills')
+
+            return {
+                'success': True,
+                'message': f'已删除 {project_count} 个项目和 {work_item_count} 条工作记录',
+                'deleted_projects': project_count,
+                'deleted_work_items': work_item_count
+            }
     except Exception as e:
         logger.error(f"Error deleting all projects: {e}")
-        conn.rollback()
         return {
             'success': False,
             'message': str(e)
         }
-    finally:
-        conn.close()
 
 
 # ========================================
@@ -1041,8 +1581,6 @@ def create_work_item(
     except Exception as e:
         logger.error(f"Error creating work item: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_work_items_by_project(project_id: int) -> List[Dict[str, Any]]:
@@ -1054,13 +1592,10 @@ def get_work_items_by_project(project_id: int) -> List[Dict[str, Any]]:
         cursor.execute('''
             SELECT * FROM work_items WHERE project_id = ? ORDER BY raw_log_date DESC
         ''', (project_id,))
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting work items: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def get_work_items_by_date_range(start_date: str, end_date: str) -> List[Dict[str, Any]]:
@@ -1076,13 +1611,10 @@ def get_work_items_by_date_range(start_date: str, end_date: str) -> List[Dict[st
             WHERE w.raw_log_date BETWEEN ? AND ?
             ORDER BY w.raw_log_date DESC
         ''', (start_date, end_date))
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting work items: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def get_all_work_items() -> List[Dict[str, Any]]:
@@ -1097,13 +1629,10 @@ def get_all_work_items() -> List[Dict[str, Any]]:
             LEFT JOIN projects p ON w.project_id = p.id
             ORDER BY w.raw_log_date DESC
         ''')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting work items: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def update_work_item(item_id: int, **kwargs) -> Optional[Dict[str, Any]]:
@@ -1139,8 +1668,6 @@ def update_work_item(item_id: int, **kwargs) -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Error updating work item: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def delete_work_item(item_id: int) -> bool:
@@ -1155,8 +1682,6 @@ def delete_work_item(item_id: int) -> bool:
     except Exception as e:
         logger.error(f"Error deleting work item: {e}")
         return False
-    finally:
-        conn.close()
 
 
 # ========================================
@@ -1251,37 +1776,34 @@ def upsert_skill(name: str, category: str = None) -> Optional[Dict[str, Any]]:
     cursor = conn.cursor()
     
     try:
-        now = datetime.now().isoformat()
-        today = now[:10]
-        
-        # Check if skill exists
-        cursor.execute('SELECT * FROM skills WHERE name = ?', (name,))
-        existing = cursor.fetchone()
-        
-        if existing:
-            cursor.execute('''
-                UPDATE skills SET 
-                    count = count + 1, 
-                    last_used_date = ?,
-                    updated_at = ?
-                WHERE name = ?
-            ''', (today, now, name))
-        else:
-            cursor.execute('''
-                INSERT INTO skills (name, category, count, first_used_date, last_used_date, created_at, updated_at)
-                VALUES (?, ?, 1, ?, ?, ?, ?)
-            ''', (name, category, today, today, now, now))
-        
-        conn.commit()
-        
-        cursor.execute('SELECT * FROM skills WHERE name = ?', (name,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        with _tx(conn):
+            now = datetime.now().isoformat()
+            today = now[:10]
+
+            # Check if skill exists
+            cursor.execute('SELECT * FROM skills WHERE name = ?', (name,))
+            existing = cursor.fetchone()
+
+            if existing:
+                cursor.execute('''
+                    UPDATE skills SET
+                        count = count + 1,
+                        last_used_date = ?,
+                        updated_at = ?
+                    WHERE name = ?
+                ''', (today, now, name))
+            else:
+                cursor.execute('''
+                    INSERT INTO skills (name, category, count, first_used_date, last_used_date, created_at, updated_at)
+                    VALUES (?, ?, 1, ?, ?, ?, ?)
+                ''', (name, category, today, today, now, now))
+
+            cursor.execute('SELECT * FROM skills WHERE name = ?', (name,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
     except Exception as e:
         logger.error(f"Error upserting skill: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def recategorize_all_skills() -> Dict[str, Any]:
@@ -1295,37 +1817,33 @@ def recategorize_all_skills() -> Dict[str, Any]:
     cursor = conn.cursor()
     
     try:
-        cursor.execute('SELECT id, name, category FROM skills')
-        skills = cursor.fetchall()
-        
-        updated_count = 0
-        now = datetime.now().isoformat()
-        
-        for skill in skills:
-            new_category = infer_skill_category(skill['name'])
-            if new_category and new_category != skill['category']:
-                cursor.execute('''
-                    UPDATE skills SET category = ?, updated_at = ? WHERE id = ?
-                ''', (new_category, now, skill['id']))
-                updated_count += 1
-        
-        conn.commit()
-        
-        return {
-            'success': True,
-            'message': f'已更新 {updated_count} 个技能的分类',
-            'updated_count': updated_count,
-            'total_skills': len(skills)
-        }
+        with _tx(conn):
+            cursor.execute('SELECT id, name, category FROM skills')
+            skills = cursor.fetchall()
+
+            updated_count = 0
+            now = datetime.now().isoformat()
+
+            for skill in skills:
+                new_category = infer_skill_category(skill['name'])
+                if new_category and new_category != skill['category']:
+                    cursor.execute('''
+                        UPDATE skills SET category = ?, updated_at = ? WHERE id = ?
+                    ''', (new_category, now, skill['id']))
+                    updated_count += 1
+
+            return {
+                'success': True,
+                'message': f'已更新 {updated_count} 个技能的分类',
+                'updated_count': updated_count,
+                'total_skills': len(skills)
+            }
     except Exception as e:
         logger.error(f"Error recategorizing skills: {e}")
-        conn.rollback()
         return {
             'success': False,
             'message': str(e)
         }
-    finally:
-        conn.close()
 
 
 def get_all_skills_for_categorization() -> List[Dict[str, Any]]:
@@ -1340,13 +1858,10 @@ def get_all_skills_for_categorization() -> List[Dict[str, Any]]:
               AND name != '' 
               AND LOWER(name) NOT IN ('null', 'none', '待补充')
         ''')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting skills for categorization: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def update_skill_categories(categorized_skills: List[Dict]) -> Dict[str, Any]:
@@ -1363,32 +1878,28 @@ def update_skill_categories(categorized_skills: List[Dict]) -> Dict[str, Any]:
     cursor = conn.cursor()
     
     try:
-        now = datetime.now().isoformat()
-        updated_count = 0
-        
-        for skill in categorized_skills:
-            cursor.execute('''
-                UPDATE skills SET category = ?, updated_at = ? WHERE id = ?
-            ''', (skill['new_category'], now, skill['id']))
-            if cursor.rowcount > 0:
-                updated_count += 1
-        
-        conn.commit()
-        
-        return {
-            'success': True,
-            'message': f'已更新 {updated_count} 个技能的分类',
-            'updated_count': updated_count
-        }
+        with _tx(conn):
+            now = datetime.now().isoformat()
+            updated_count = 0
+
+            for skill in categorized_skills:
+                cursor.execute('''
+                    UPDATE skills SET category = ?, updated_at = ? WHERE id = ?
+                ''', (skill['new_category'], now, skill['id']))
+                if cursor.rowcount > 0:
+                    updated_count += 1
+
+            return {
+                'success': True,
+                'message': f'已更新 {updated_count} 个技能的分类',
+                'updated_count': updated_count
+            }
     except Exception as e:
         logger.error(f"Error updating skill categories: {e}")
-        conn.rollback()
         return {
             'success': False,
             'message': str(e)
         }
-    finally:
-        conn.close()
 
 
 def get_work_items_by_skill(skill_name: str) -> List[Dict[str, Any]]:
@@ -1417,13 +1928,10 @@ def get_work_items_by_skill(skill_name: str) -> List[Dict[str, Any]]:
             ORDER BY w.raw_log_date DESC
         ''', (search_pattern,))
         
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting work items by skill: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def get_all_skills() -> List[Dict[str, Any]]:
@@ -1440,13 +1948,10 @@ def get_all_skills() -> List[Dict[str, Any]]:
               AND LOWER(name) NOT IN ('null', 'none', '待补充')
             ORDER BY count DESC
         ''')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting skills: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def get_skills_stats() -> Dict[str, Any]:
@@ -1491,8 +1996,6 @@ def get_skills_stats() -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error getting skills stats: {e}")
         return {'top_skills': [], 'by_category': {}, 'total_unique': 0}
-    finally:
-        conn.close()
 
 
 def get_project_with_work_items(project_id: int) -> Optional[Dict[str, Any]]:
@@ -1520,13 +2023,10 @@ def get_projects_summary() -> List[Dict[str, Any]]:
             GROUP BY p.id
             ORDER BY p.updated_at DESC
         ''')
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return _fetch_all_dicts(cursor)
     except Exception as e:
         logger.error(f"Error getting projects summary: {e}")
         return []
-    finally:
-        conn.close()
 
 
 def merge_null_projects_to_temporary() -> Dict[str, Any]:
@@ -1541,76 +2041,72 @@ def merge_null_projects_to_temporary() -> Dict[str, Any]:
     cursor = conn.cursor()
     
     try:
-        # 1. 查找或创建"临时工作"项目
-        cursor.execute("SELECT id FROM projects WHERE name = '临时工作'")
-        row = cursor.fetchone()
-        
-        if row:
-            temp_project_id = row['id']
-        else:
-            now = datetime.now().isoformat()
+        with _tx(conn):
+            # 1. 查找或创建"临时工作"项目
+            cursor.execute("SELECT id FROM projects WHERE name = '临时工作'")
+            row = cursor.fetchone()
+
+            if row:
+                temp_project_id = row['id']
+            else:
+                now = datetime.now().isoformat()
+                cursor.execute('''
+                    INSERT INTO projects (name, description, status, created_at, updated_at)
+                    VALUES ('临时工作', '未归类到具体项目的临时性工作', 'active', ?, ?)
+                ''', (now, now))
+                temp_project_id = cursor.lastrowid
+
+            # 2. 查找所有无效项目（null、空、undefined等）
             cursor.execute('''
-                INSERT INTO projects (name, description, status, created_at, updated_at)
-                VALUES ('临时工作', '未归类到具体项目的临时性工作', 'active', ?, ?)
-            ''', (now, now))
-            temp_project_id = cursor.lastrowid
-        
-        # 2. 查找所有无效项目（null、空、undefined等）
-        cursor.execute('''
-            SELECT id, name FROM projects 
-            WHERE name IS NULL 
-               OR name = 'null' 
-               OR name = 'undefined'
-               OR TRIM(name) = ''
-        ''')
-        invalid_projects = cursor.fetchall()
-        
-        if not invalid_projects:
+                SELECT id, name FROM projects
+                WHERE name IS NULL
+                   OR name = 'null'
+                   OR name = 'undefined'
+                   OR TRIM(name) = ''
+            ''')
+            invalid_projects = cursor.fetchall()
+
+            if not invalid_projects:
+                return {
+                    'success': True,
+                    'message': '没有需要处理的无效项目',
+                    'merged_count': 0,
+                    'deleted_projects': 0
+                }
+
+            invalid_project_ids = [p['id'] for p in invalid_projects]
+
+            # 3. 将这些项目的工作条目迁移到"临时工作"
+            placeholders = ','.join('?' * len(invalid_project_ids))
+            cursor.execute(f'''
+                UPDATE work_items
+                SET project_id = ?
+                WHERE project_id IN ({placeholders})
+            ''', [temp_project_id] + invalid_project_ids)
+            merged_count = cursor.rowcount
+
+            # 4. 删除这些无效项目
+            cursor.execute(f'''
+                DELETE FROM projects WHERE id IN ({placeholders})
+            ''', invalid_project_ids)
+            deleted_count = cursor.rowcount
+
             return {
                 'success': True,
-                'message': '没有需要处理的无效项目',
-                'merged_count': 0,
-                'deleted_projects': 0
+                'message': f'成功将 {merged_count} 条工作记录合并到"临时工作"项目',
+                'merged_count': merged_count,
+                'deleted_projects': deleted_count,
+                'temp_project_id': temp_project_id
             }
-        
-        invalid_project_ids = [p['id'] for p in invalid_projects]
-        
-        # 3. 将这些项目的工作条目迁移到"临时工作"
-        placeholders = ','.join('?' * len(invalid_project_ids))
-        cursor.execute(f'''
-            UPDATE work_items 
-            SET project_id = ? 
-            WHERE project_id IN ({placeholders})
-        ''', [temp_project_id] + invalid_project_ids)
-        merged_count = cursor.rowcount
-        
-        # 4. 删除这些无效项目
-        cursor.execute(f'''
-            DELETE FROM projects WHERE id IN ({placeholders})
-        ''', invalid_project_ids)
-        deleted_count = cursor.rowcount
-        
-        conn.commit()
-        
-        return {
-            'success': True,
-            'message': f'成功将 {merged_count} 条工作记录合并到"临时工作"项目',
-            'merged_count': merged_count,
-            'deleted_projects': deleted_count,
-            'temp_project_id': temp_project_id
-        }
-        
+
     except Exception as e:
         logger.error(f"Error merging null projects: {e}")
-        conn.rollback()
         return {
             'success': False,
             'message': str(e),
             'merged_count': 0,
             'deleted_projects': 0
         }
-    finally:
-        conn.close()
 
 
 def merge_similar_projects(target_project_id: int, source_project_ids: List[int]) -> Dict[str, Any]:
@@ -1628,62 +2124,58 @@ def merge_similar_projects(target_project_id: int, source_project_ids: List[int]
     cursor = conn.cursor()
     
     try:
-        # 确保目标项目存在
-        cursor.execute('SELECT id, name FROM projects WHERE id = ?', (target_project_id,))
-        target = cursor.fetchone()
-        if not target:
-            return {
-                'success': False,
-                'message': f'目标项目 {target_project_id} 不存在'
-            }
-        
-        # 过滤掉目标项目ID
-        source_ids = [sid for sid in source_project_ids if sid != target_project_id]
-        
-        if not source_ids:
+        with _tx(conn):
+            # 确保目标项目存在
+            cursor.execute('SELECT id, name FROM projects WHERE id = ?', (target_project_id,))
+            target = cursor.fetchone()
+            if not target:
+                return {
+                    'success': False,
+                    'message': f'目标项目 {target_project_id} 不存在'
+                }
+
+            # 过滤掉目标项目ID
+            source_ids = [sid for sid in source_project_ids if sid != target_project_id]
+
+            if not source_ids:
+                return {
+                    'success': True,
+                    'message': '没有需要合并的项目',
+                    'merged_count': 0
+                }
+
+            # 迁移工作条目
+            placeholders = ','.join('?' * len(source_ids))
+            cursor.execute(f'''
+                UPDATE work_items
+                SET project_id = ?
+                WHERE project_id IN ({placeholders})
+            ''', [target_project_id] + source_ids)
+            merged_count = cursor.rowcount
+
+            # 删除源项目
+            cursor.execute(f'''
+                DELETE FROM projects WHERE id IN ({placeholders})
+            ''', source_ids)
+            deleted_count = cursor.rowcount
+
+            # 更新目标项目的更新时间
+            now = datetime.now().isoformat()
+            cursor.execute('UPDATE projects SET updated_at = ? WHERE id = ?', (now, target_project_id))
+
             return {
                 'success': True,
-                'message': '没有需要合并的项目',
-                'merged_count': 0
+                'message': f'成功将 {merged_count} 条工作记录合并到项目 "{target["name"]}"',
+                'merged_count': merged_count,
+                'deleted_projects': deleted_count
             }
-        
-        # 迁移工作条目
-        placeholders = ','.join('?' * len(source_ids))
-        cursor.execute(f'''
-            UPDATE work_items 
-            SET project_id = ? 
-            WHERE project_id IN ({placeholders})
-        ''', [target_project_id] + source_ids)
-        merged_count = cursor.rowcount
-        
-        # 删除源项目
-        cursor.execute(f'''
-            DELETE FROM projects WHERE id IN ({placeholders})
-        ''', source_ids)
-        deleted_count = cursor.rowcount
-        
-        # 更新目标项目的更新时间
-        now = datetime.now().isoformat()
-        cursor.execute('UPDATE projects SET updated_at = ? WHERE id = ?', (now, target_project_id))
-        
-        conn.commit()
-        
-        return {
-            'success': True,
-            'message': f'成功将 {merged_count} 条工作记录合并到项目 "{target["name"]}"',
-            'merged_count': merged_count,
-            'deleted_projects': deleted_count
-        }
-        
+
     except Exception as e:
         logger.error(f"Error merging projects: {e}")
-        conn.rollback()
         return {
             'success': False,
             'message': str(e)
         }
-    finally:
-        conn.close()
 
 
 def find_similar_project_groups(threshold: float = 0.6) -> List[Dict[str, Any]]:
@@ -1771,14 +2263,12 @@ def save_config(key: str, value: dict) -> bool:
         ''', (key, value_json))
         
         conn.commit()
-        logger.info(f"Config saved for key: {key}")
+        logger.debug(f"Config saved for key: {key}")
         return True
         
     except Exception as e:
         logger.error(f"Error saving config: {e}")
         return False
-    finally:
-        conn.close()
 
 
 def get_config(key: str) -> Optional[Dict[str, Any]]:
@@ -1810,8 +2300,6 @@ def get_config(key: str) -> Optional[Dict[str, Any]]:
     except Exception as e:
         logger.error(f"Error getting config: {e}")
         return None
-    finally:
-        conn.close()
 
 
 def delete_config(key: str) -> bool:
@@ -1835,9 +2323,3 @@ def delete_config(key: str) -> bool:
     except Exception as e:
         logger.error(f"Error deleting config: {e}")
         return False
-    finally:
-        conn.close()
-
-
-# Initialize database on module import
-init_database()
@@ -4,11 +4,14 @@
 generator.py - Weekly report and OKR generation logic
 """
 
+import hashlib
 import logging
 import re
 import json
+import threading
+from collections import OrderedDict
 from typing import Dict, Optional, List
-from parser import parse_and_categorize, get_current_week_range, format_date
+from parser import parse_and_categorize
 from llm_client import get_llm_client, LLMClient
 from prompts import (
     get_weekly_report_system_prompt,
@@ -21,6 +24,60 @@ from config import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns — validation runs after every generate call, so
+# avoid rebuilding these on each request
+_OBJECTIVE_RE = re.compile(r'目标\s*O\d+')
+_KR_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}前')
+_KR_BLOCK_RE = re.compile(r'KR\d+[：:].+?(?=KR\d+|目标\s*O\d+|$)', re.DOTALL)
+_QUANT_RES = [re.compile(p) for p in (
+    r'≥|>=|≤|<=',
+    r'\d+%',
+    r'准确率',
+    r'覆盖率',
+    r'覆盖',
+    r'数量',
+    r'上线',
+    r'验收',
+    r'性能',
+    r'可用性'
+)]
+_JSON_CODE_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_RAW_JSON_RE = re.compile(r'\{[\s\S]*\}')
+
+# Small in-process LRU for generated results. Temperature is fixed at 0,
+# so identical input produces identical output — repeated generate clicks
+# on unchanged content skip the LLM round trip entirely.
+_GEN_CACHE_MAX = 64
+_gen_cache: OrderedDict = OrderedDict()
+_gen_cache_lock = threading.Lock()
+
+
+def _gen_cache_key(*parts) -> str:
+    """Build a cache key by hashing all inputs that affect the output."""
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(str(part).encode('utf-8'))
+        h.update(b'\x00')
+    return h.hexdigest()
+
+
+def _gen_cache_get(key: str) -> Optional[Dict]:
+    with _gen_cache_lock:
+        result = _gen_cache.get(key)
+        if result is None:
+            return None
+        _gen_cache.move_to_end(key)
+        # Shallow copy so callers can attach e.g. 'validation' safely
+        return dict(result)
+
+
+def _gen_cache_put(key: str, result: Dict) -> None:
+    with _gen_cache_lock:
+        _gen_cache[key] = dict(result)
+        _gen_cache.move_to_end(key)
+        while len(_gen_cache) > _GEN_CACHE_MAX:
+            _gen_cache.popitem(last=False)
+
 
 def generate_weekly_report(
     daily_content: str, 
@@ -52,6 +109,11 @@ def generate_weekly_report(
             'parsed_data': None
         }
     
+    cache_key = _gen_cache_key('weekly', daily_content, use_mock, start_date, end_date)
+    cached = _gen_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Parse and categorize content
         parsed_data = parse_and_categorize(daily_content)
@@ -73,12 +135,17 @@ def generate_weekly_report(
         
         # Call LLM
         report = llm_client.call(user_prompt, system_prompt)
-        
-        return {
+
+        result = {
             'success': True,
             'report': report,
-            'parsed_data': parsed_data
+            'parsed_data': parsed_data,
+            # Validate here so the API layer gets one finished payload
+            # (and cache hits skip revalidation too)
+            'validation': validate_weekly_report(report)
         }
+        _gen_cache_put(cache_key, result)
+        return result
         
     except Exception as e:
         logger.error(f"Weekly report generation failed: {e}")
@@ -111,21 +178,29 @@ def generate_okr(content: str, next_quarter: str = "2026第一季度", use_mock:
             'error': f'输入超过最大长度限制 ({Config.MAX_INPUT_CHARS} 字符)'
         }
     
+    cache_key = _gen_cache_key('okr', content, next_quarter, use_mock)
+    cached = _gen_cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Get LLM client
         llm_client = get_llm_client(use_mock=use_mock)
-        
+
         # Generate prompts
         system_prompt = get_okr_system_prompt()
         user_prompt = get_okr_user_prompt(content, next_quarter)
-        
+
         # Call LLM
         okr = llm_client.call(user_prompt, system_prompt)
-        
-        return {
+
+        result = {
             'success': True,
-            'okr': okr
+            'okr': okr,
+            'validation': validate_okr(okr)
         }
+        _gen_cache_put(cache_key, result)
+        return result
         
     except Exception as e:
         logger.error(f"OKR generation failed: {e}")
@@ -190,42 +265,24 @@ def validate_okr(okr: str) -> Dict:
     Returns:
         Dict with validation results
     """
-    import re
-    
     # Check for objectives (O1, O2, etc.)
-    objective_pattern = r'目标\s*O\d+'
-    objectives = re.findall(objective_pattern, okr)
-    
+    objectives = _OBJECTIVE_RE.findall(okr)
+
     # Check for KRs with date nodes
-    kr_date_pattern = r'\d{4}-\d{2}-\d{2}前'
-    date_nodes = re.findall(kr_date_pattern, okr)
-    
+    date_nodes = _KR_DATE_RE.findall(okr)
+
     # Check for quantitative expressions
-    quant_patterns = [
-        r'≥|>=|≤|<=',
-        r'\d+%',
-        r'准确率',
-        r'覆盖率',
-        r'覆盖',
-        r'数量',
-        r'上线',
-        r'验收',
-        r'性能',
-        r'可用性'
-    ]
-    
     quant_found = []
-    for pattern in quant_patterns:
-        if re.search(pattern, okr):
-            quant_found.append(pattern)
-    
+    for pattern in _QUANT_RES:
+        if pattern.search(okr):
+            quant_found.append(pattern.pattern)
+
     # Check for milestones (multiple date nodes in same KR suggest milestones)
-    kr_pattern = r'KR\d+[：:].+?(?=KR\d+|目标\s*O\d+|$)'
-    krs = re.findall(kr_pattern, okr, re.DOTALL)
-    
+    krs = _KR_BLOCK_RE.findall(okr)
+
     has_milestones = False
     for kr in krs:
-        dates_in_kr = re.findall(kr_date_pattern, kr)
+        dates_in_kr = _KR_DATE_RE.findall(kr)
         if len(dates_in_kr) >= 2:
             has_milestones = True
             break
@@ -355,12 +412,12 @@ def extract_work_items(log_content: str, log_date: str, use_mock: bool = False)
         
         # Parse JSON response
         # Try to extract JSON from response (may have markdown code blocks)
-        json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
+        json_match = _JSON_CODE_BLOCK_RE.search(response)
         if json_match:
             json_str = json_match.group(1)
         else:
             # Try to find raw JSON
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _RAW_JSON_RE.search(response)
             if json_match:
                 json_str = json_match.group(0)
             else:
@@ -514,7 +571,7 @@ def categorize_skills_with_llm(skills: List[Dict], use_mock: bool = False) -> Di
         # 解析 LLM 返回的 JSON
         try:
             # 尝试提取 JSON
-            json_match = re.search(r'\{[\s\S]*\}', response)
+            json_match = _RAW_JSON_RE.search(response)
             if json_match:
                 categories_map = json.loads(json_match.group())
             else:
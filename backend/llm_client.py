@@ -214,11 +214,9 @@ class MockLLMClient:
         """Generate mock weekly report"""
         # Extract week range from prompt if possible
         import re
-        from parser import get_current_week_range, format_date
-        
-        monday, friday = get_current_week_range()
-        monday_str = format_date(monday)
-        friday_str = format_date(friday)
+        from parser import get_current_week_range_str
+
+        monday_str, friday_str = get_current_week_range_str()
         
         return f"""周报（{monday_str} ~ {friday_str}）
 
@@ -36,6 +36,18 @@ def format_date(dt: datetime) -> str:
     return dt.strftime('%Y-%m-%d')
 
 
+def get_current_week_range_str() -> Tuple[str, str]:
+    """
+    Get the current week's Monday-Friday range already formatted as
+    YYYY-MM-DD strings, for the callers that only need the strings.
+
+    Returns:
+        Tuple of (monday_str, friday_str)
+    """
+    monday, friday = get_current_week_range()
+    return format_date(monday), format_date(friday)
+
+
 def parse_date_block(text: str) -> List[Dict]:
     """
     Parse daily report text into date blocks.
@@ -253,20 +265,20 @@ def parse_and_categorize(text: str) -> Dict:
         - categories: categorized and deduplicated entries
         - week_range: current week Monday-Friday
     """
-    monday, friday = get_current_week_range()
-    
+    monday, friday = get_current_week_range_str()
+
     blocks = parse_date_block(text)
     categories = categorize_entries(blocks)
-    
+
     # Deduplicate each category
     for cat in categories:
         categories[cat] = deduplicate_entries(categories[cat])
-    
+
     return {
         'blocks': blocks,
         'categories': categories,
         'week_range': {
-            'monday': format_date(monday),
-            'friday': format_date(friday)
+            'monday': monday,
+            'friday': friday
         }
     }
@@ -4,8 +4,6 @@
 prompts.py - Prompt templates for LLM generation
 """
 
-from parser import get_current_week_range, format_date
-
 
 def get_weekly_report_system_prompt() -> str:
     """Get system prompt for weekly report generation"""
@@ -56,14 +54,15 @@ def get_weekly_report_user_prompt(monday: str, friday: str, content: str) -> str
         friday: Week end date (YYYY-MM-DD)
         content: Daily report content
     """
+    # 固定指令放前缀、可变内容放末尾：provider 端的 prompt 缓存按
+    # 前缀命中，这样每次请求只有尾部的日期和日报内容是新 token
     return f"""请根据以下日报内容生成周报。
+请严格按照系统提示中的格式输出周报。
 
 周范围：{monday} ~ {friday}
 
 日报内容：
-{content}
-
-请严格按照系统提示中的格式输出周报。"""
+{content}"""
 
 
 def get_okr_system_prompt() -> str:
@@ -108,15 +107,16 @@ def get_okr_user_prompt(content: str, next_quarter: str = "2026第一季度") ->
         content: Historical materials, weekly reports, etc.
         next_quarter: Target quarter string
     """
-    return f"""请根据以下材料生成{next_quarter}OKR。
-
-历史材料/周报内容：
-{content}
-
+    return f"""请根据以下材料生成下一季度OKR。
 请严格按照系统提示中的格式和约束输出OKR。确保：
 1. 生成2-3个目标
 2. 每个KR包含日期节点（YYYY-MM-DD前）和量化表达
-3. 关键KR包含阶段里程碑（M1/M2/M3）"""
+3. 关键KR包含阶段里程碑（M1/M2/M3）
+
+目标季度：{next_quarter}
+
+历史材料/周报内容：
+{content}"""
 
 
 # ========================================
@@ -170,13 +170,12 @@ def get_work_item_extraction_user_prompt(log_content: str, log_date: str) -> str
         log_date: Date of the log (YYYY-MM-DD)
     """
     return f"""请从以下日志中提取结构化工作项。
+请严格按照JSON格式输出提取结果。只提取日志中明确提到的信息，不要编造。
 
 日期：{log_date}
 
 日志内容：
-{log_content}
-
-请严格按照JSON格式输出提取结果。只提取日志中明确提到的信息，不要编造。"""
+{log_content}"""
 
 
 def get_star_summary_system_prompt() -> str:
@@ -228,9 +227,8 @@ def get_star_summary_user_prompt(project_name: str, work_items: list) -> str:
             items_text += f" | 技能：{item['skills_tags']}"
     
     return f"""请为以下项目生成一段 STAR 格式的简历描述。
+请基于以下记录，生成一段专业、简洁的项目描述。
 
 项目名称：{project_name}
 
-相关工作记录：{items_text}
-
-请基于以上记录，生成一段专业、简洁的项目描述。"""
+相关工作记录：{items_text}"""
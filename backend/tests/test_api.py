@@ -73,10 +73,19 @@ class TestParseEndpoint:
         """Test error when content is missing"""
         response = client.post('/api/parse', json={})
         assert response.status_code == 400
-        
+
         data = json.loads(response.data)
         assert data['success'] is False
 
+    def test_parse_non_dict_body(self, client):
+        """Test error when the JSON body is not an object"""
+        for body in ([{'content': 'x'}], 5):
+            response = client.post('/api/parse', json=body)
+            assert response.status_code == 400
+
+            data = json.loads(response.data)
+            assert data['success'] is False
+
 
 class TestWeeklyReportEndpoint:
     """Tests for weekly report generation endpoint"""
@@ -192,5 +201,148 @@ KR1：2026-01-31前完成优化，准确率≥90%；"""
         assert 'validation' in data
 
 
+class TestDailyReportBulkEndpoint:
+    """Tests for daily report bulk save endpoint"""
+
+    def test_bulk_save(self, client):
+        """Test saving multiple daily reports in one request"""
+        items = [
+            {'entry_date': '2030-01-06', 'content': '完成部署工作'},
+            {'entry_date': '2030-01-07', 'content': '修复提取问题'}
+        ]
+        response = client.post('/api/daily-reports/bulk', json={'items': items})
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['success'] is True
+
+        # Saved items are readable individually
+        response = client.get('/api/daily-reports/2030-01-06')
+        assert json.loads(response.data)['data']['content'] == '完成部署工作'
+
+        for item in items:
+            client.delete(f"/api/daily-reports/{item['entry_date']}")
+
+    def test_bulk_save_missing_items(self, client):
+        """Test error when items field is missing"""
+        response = client.post('/api/daily-reports/bulk', json={})
+        assert response.status_code == 400
+
+    def test_bulk_save_non_dict_item(self, client):
+        """Test error when an item is not an object"""
+        response = client.post('/api/daily-reports/bulk', json={'items': [5]})
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+        assert data['success'] is False
+
+    def test_bulk_save_item_missing_field(self, client):
+        """Test error when an item lacks a required field"""
+        response = client.post(
+            '/api/daily-reports/bulk',
+            json={'items': [{'entry_date': '2030-01-06'}]}
+        )
+        assert response.status_code == 400
+
+    def test_bulk_save_large_payload(self, client):
+        """Test bulk payload above the single-document size cap is accepted"""
+        items = [
+            {'entry_date': f'2030-02-{day:02d}', 'content': 'x' * 15000}
+            for day in range(1, 11)
+        ]
+        response = client.post('/api/daily-reports/bulk', json={'items': items})
+        assert response.status_code == 200
+
+        for item in items:
+            client.delete(f"/api/daily-reports/{item['entry_date']}")
+
+
+class TestOKRBulkEndpoint:
+    """Tests for OKR bulk save endpoint"""
+
+    def test_bulk_save(self, client):
+        """Test saving multiple OKR reports in one request"""
+        items = [
+            {'creation_date': '2030-01-06', 'content': '目标 O1：提升稳定性'},
+            {'creation_date': '2030-01-07', 'content': '目标 O1：提升准确率'}
+        ]
+        response = client.post('/api/okr-reports/bulk', json={'items': items})
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['success'] is True
+
+        response = client.get('/api/okr-reports/2030-01-07')
+        assert json.loads(response.data)['data']['content'] == '目标 O1：提升准确率'
+
+        for item in items:
+            client.delete(f"/api/okr-reports/{item['creation_date']}")
+
+    def test_bulk_save_non_dict_item(self, client):
+        """Test error when an item is not an object"""
+        response = client.post('/api/okr-reports/bulk', json={'items': [5]})
+        assert response.status_code == 400
+
+
+class TestReportListEndpoints:
+    """Tests for the content-free listing endpoints"""
+
+    def test_weekly_report_list(self, client):
+        """Test weekly report listing omits content"""
+        client.post('/api/weekly-reports', json={
+            'start_date': '2030-01-06',
+            'end_date': '2030-01-10',
+            'content': '周报内容'
+        })
+
+        response = client.get('/api/weekly-reports/list')
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['success'] is True
+        entry = next(e for e in data['data'] if e['start_date'] == '2030-01-06')
+        assert 'content' not in entry
+
+        client.delete('/api/weekly-reports?start_date=2030-01-06&end_date=2030-01-10')
+
+    def test_okr_report_list(self, client):
+        """Test OKR listing returns summaries without content"""
+        client.post('/api/okr-reports', json={
+            'creation_date': '2030-01-06',
+            'content': '目标 O1：提升稳定性'
+        })
+
+        response = client.get('/api/okr-reports/list')
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        entry = next(e for e in data['data'] if e['creation_date'] == '2030-01-06')
+        assert 'content' not in entry
+        assert entry['size'] > 0
+
+        client.delete('/api/okr-reports/2030-01-06')
+
+
+class TestRequestGuards:
+    """Tests for routing and body-size request guards"""
+
+    def test_malformed_date_returns_404(self, client):
+        """Test malformed date path segments are rejected during routing"""
+        response = client.get('/api/daily-reports/not-a-date')
+        assert response.status_code == 404
+
+    def test_oversized_body_returns_413(self, client):
+        """Test oversized single-document requests are rejected early"""
+        response = client.post(
+            '/api/parse',
+            data='x' * (20000 * 4 + 8192),
+            content_type='application/json'
+        )
+        assert response.status_code == 413
+
+        data = json.loads(response.data)
+        assert data['success'] is False
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
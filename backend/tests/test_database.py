@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+test_database.py - Tests for the SQLite database module
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import database as db
+
+
+@pytest.fixture
+def tmp_db(tmp_path, monkeypatch):
+    """Point the database module at a fresh temporary database"""
+    monkeypatch.setattr(db, 'DB_PATH', str(tmp_path / 'test.db'))
+    monkeypatch.setattr(db._local, 'conn', None, raising=False)
+    monkeypatch.setattr(db, '_schema_ready', False)
+    db._okr_cache_invalidate()
+
+    yield db
+
+    conn = getattr(db._local, 'conn', None)
+    if conn is not None:
+        conn.close()
+    db._local.conn = None
+    db._okr_cache_invalidate()
+
+
+class TestOKRContentRoundTrip:
+    """Tests for OKR content storage round-tripping"""
+
+    def test_plain_round_trip(self, tmp_db):
+        """Test short content is stored and read back unchanged"""
+        content = '目标 O1：提升稳定性'
+        assert tmp_db.save_okr_report('2030-01-06', content)
+        assert tmp_db.get_okr_report('2030-01-06')['content'] == content
+
+    def test_large_round_trip(self, tmp_db):
+        """Test content above the compression threshold round-trips"""
+        content = '目标 O1：提升稳定性\n' + 'KR1：准确率≥90%；\n' * 200
+        assert tmp_db.save_okr_report('2030-01-07', content)
+        assert tmp_db.get_okr_report('2030-01-07')['content'] == content
+
+    @pytest.mark.skipif(not db.HAS_ZSTD, reason='zstandard not installed')
+    def test_large_content_stored_compressed(self, tmp_db):
+        """Test large content is stored as a zstd frame"""
+        content = 'x' * 2000
+        assert tmp_db.save_okr_report('2030-01-08', content)
+
+        conn = tmp_db.get_db_connection()
+        stored = conn.execute(
+            'SELECT content FROM okr_reports WHERE creation_date = ?',
+            ('2030-01-08',)
+        ).fetchone()['content']
+        assert isinstance(stored, bytes)
+        assert stored[:4] == tmp_db._ZSTD_MAGIC
+        assert tmp_db.get_okr_report('2030-01-08')['content'] == content
+
+    def test_unreadable_blob_degrades(self, tmp_db):
+        """Test an unreadable content blob reads as empty, not an error"""
+        conn = tmp_db.get_db_connection()
+        conn.execute(
+            'INSERT INTO okr_reports (creation_date, content) VALUES (?, ?)',
+            ('2030-01-09', tmp_db._ZSTD_MAGIC + b'\x00' * 8)
+        )
+        report = tmp_db.get_okr_report('2030-01-09')
+        assert report['content'] == ''
+
+
+class TestOKRCache:
+    """Tests for the OKR read cache and writer invalidation"""
+
+    def test_save_invalidates_read_cache(self, tmp_db):
+        """Test a save is visible through a previously cached read"""
+        tmp_db.save_okr_report('2030-01-06', '初版内容')
+        assert tmp_db.get_okr_report('2030-01-06')['content'] == '初版内容'
+
+        tmp_db.save_okr_report('2030-01-06', '更新内容')
+        assert tmp_db.get_okr_report('2030-01-06')['content'] == '更新内容'
+
+    def test_delete_invalidates_read_cache(self, tmp_db):
+        """Test a delete is visible through a previously cached read"""
+        tmp_db.save_okr_report('2030-01-06', '内容')
+        assert tmp_db.get_okr_report('2030-01-06') is not None
+
+        assert tmp_db.delete_okr_report('2030-01-06')
+        assert tmp_db.get_okr_report('2030-01-06') is None
+
+    def test_latest_tracks_writes(self, tmp_db):
+        """Test the cached latest report follows new saves"""
+        tmp_db.save_okr_report('2030-01-06', '旧')
+        assert tmp_db.get_latest_okr_report()['creation_date'] == '2030-01-06'
+
+        tmp_db.save_okr_report('2030-01-07', '新')
+        assert tmp_db.get_latest_okr_report()['creation_date'] == '2030-01-07'
+
+    def test_cached_report_copies_are_independent(self, tmp_db):
+        """Test mutating a returned report doesn't poison the cache"""
+        tmp_db.save_okr_report('2030-01-06', '内容')
+        report = tmp_db.get_okr_report('2030-01-06')
+        report['content'] = '篡改'
+        assert tmp_db.get_okr_report('2030-01-06')['content'] == '内容'
+
+
+class TestBulkSave:
+    """Tests for the bulk save paths"""
+
+    def test_bulk_save_and_read_back(self, tmp_db):
+        """Test bulk-saved OKR reports are all readable"""
+        items = [
+            {'creation_date': f'2030-03-{day:02d}', 'content': f'内容 {day}'}
+            for day in range(1, 6)
+        ]
+        assert tmp_db.save_okr_reports_bulk(items)
+        assert len(tmp_db.get_all_okr_reports()) == 5
+
+    def test_bulk_save_chunked(self, tmp_db):
+        """Test a bulk save spanning multiple chunks commits every row"""
+        items = [
+            {'creation_date': f'2030-04-{day:02d}', 'content': '内容'}
+            for day in range(1, 8)
+        ]
+        assert tmp_db.save_okr_reports_bulk(items, chunk_size=3)
+        assert len(tmp_db.get_all_okr_reports()) == 7
+
+    def test_bulk_save_empty(self, tmp_db):
+        """Test an empty bulk save is a no-op success"""
+        assert tmp_db.save_okr_reports_bulk([])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -28,9 +28,14 @@ fi
 
 echo "[2/3] 启动后端服务（端口 5001）..."
 
-# 启动后端
+# 启动后端（优先使用 gunicorn + gevent，未安装时回退到 Flask 开发服务器）
 cd "$PROJECT_ROOT/backend"
-nohup python3 app.py > backend.log 2>&1 &
+if command -v gunicorn >/dev/null 2>&1 ; then
+    nohup gunicorn --bind 0.0.0.0:5001 --workers 2 --worker-class gevent \
+        --worker-connections 100 --timeout 60 app:app > backend.log 2>&1 &
+else
+    PORT=5001 nohup python3 app.py > backend.log 2>&1 &
+fi
 BACKEND_PID=$!
 
 echo "后端服务已在后台启动"